@@ -0,0 +1,28 @@
+"""add username index
+
+Revision ID: 8f2c6a1d94e7
+Revises: 36b5774d0b57
+Create Date: 2026-08-26 11:12:40.281553
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f2c6a1d94e7'
+down_revision: Union[str, None] = '36b5774d0b57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_users_username'), 'users', ['username'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_users_username'), table_name='users')
@@ -1,12 +1,14 @@
+import time
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, SecurityScopes
 from typing import Annotated
 from loguru import logger
-from jose import JWTError
-from sqlalchemy import select
+from jwt.exceptions import PyJWTError
+from sqlalchemy import select, bindparam
+from sqlalchemy.orm import load_only
 
 from .models import User
-from ..database.session import DbSessionDepends
+from ..database.session import DbSession
 from ..database.executer import sql_manager
 from .handler import AuthHandler
 from .scopes_dict import scopes
@@ -22,11 +24,99 @@ NotAuthException = HTTPException(
     headers={"WWW-Authenticate": "Bearer"}
 )
 
+_JWT_CACHE_TTL = 60                     # Сколько секунд хранить расшифрованный payload токена
+_JWT_CACHE_MAX_SIZE = 1024              # Максимальный размер кэша токенов
+_jwt_cache: dict[str, tuple[float, dict]] = {}
+
+
+async def _decode_jwt_cached(token: str) -> dict:
+    """Декодирует JWT токен с кэшированием результата.
+
+    Проверка подписи HMAC выполняется на каждый авторизированный запрос,
+    хотя сам токен между запросами не меняется. Payload кэшируется на
+    короткий TTL (не дольше, чем живет сам токен), чтобы не проверять
+    подпись повторно.
+
+    Args:
+        token(str): JWT токен
+
+    Returns:
+        dict: Раскодированные данные из токена
+
+    Raises:
+        PyJWTError: Если токен невалидный
+    """
+    now = time.time()
+    cached = _jwt_cache.get(token)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    payload = await AuthHandler.decode_jwt(token)
+
+    # Не даем кэшу расти бесконечно: сначала чистим протухшие записи
+    if len(_jwt_cache) >= _JWT_CACHE_MAX_SIZE:
+        for key, (expires_at, _) in list(_jwt_cache.items()):
+            if expires_at <= now:
+                _jwt_cache.pop(key, None)
+        if len(_jwt_cache) >= _JWT_CACHE_MAX_SIZE:
+            _jwt_cache.clear()
+
+    # Кэшируем не дольше, чем действует сам токен (поле exp)
+    expires_at = min(now + _JWT_CACHE_TTL, float(payload.get('exp', now + _JWT_CACHE_TTL)))
+    _jwt_cache[token] = (expires_at, payload)
+    return payload
+
+
+# Запрос строится один раз при импорте, значение почты подставляется через .params()
+_CURRENT_USER_STMT = (
+    select(User)
+    .options(load_only(User.username, User.email, User.scopes))
+    .where(User.email == bindparam('email'))
+)
+
+_USER_CACHE_TTL = 60                    # Сколько секунд хранить пользователя, найденного по токену
+_USER_CACHE_MAX_SIZE = 1024             # Максимальный размер кэша пользователей
+_user_cache: dict[str, tuple[float, User]] = {}
+
+
+async def _get_user_cached(email: str, db_session) -> User | None:
+    """Ищет пользователя по почте с кэшированием результата.
+
+    Каждый авторизированный запрос ходил в базу за одним и тем же
+    пользователем. Найденный объект кэшируется на короткий TTL, чтобы
+    убрать этот round-trip для повторных запросов.
+
+    Args:
+        email(str): Почта пользователя из токена
+        db_session(AsyncSession): Сессия базы данных
+
+    Returns:
+        User | None: Объект пользователя или None, если не найден
+    """
+    now = time.time()
+    cached = _user_cache.get(email)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    user = await sql_manager(
+        _CURRENT_USER_STMT.params(email=email)
+    ).scalar_one_or_none(db_session)
+
+    if user is not None:
+        if len(_user_cache) >= _USER_CACHE_MAX_SIZE:
+            for key, (expires_at, _) in list(_user_cache.items()):
+                if expires_at <= now:
+                    _user_cache.pop(key, None)
+            if len(_user_cache) >= _USER_CACHE_MAX_SIZE:
+                _user_cache.clear()
+        _user_cache[email] = (now + _USER_CACHE_TTL, user)
+    return user
+
 
 async def get_current_user(
         security_scopes: SecurityScopes,
         token: Annotated[str, Depends(oauth2_scheme)],
-        db_session: DbSessionDepends()
+        db_session: DbSession
 ) -> User:
     """Получает текущего пользователя по JWT токену.
 
@@ -42,7 +132,7 @@ async def get_current_user(
         NotAuthException(401): Если токен невалидный или пользователь не найден
     """
     try:
-        payload = await AuthHandler.decode_jwt(token)
+        payload = await _decode_jwt_cached(token)
         email = payload.get('sub')
         if email is None:
             raise NotAuthException
@@ -50,9 +140,7 @@ async def get_current_user(
         scope: str = payload.get("scope", "")
         token_scopes = scope.split(" ")
 
-        user = await sql_manager(
-            select(User).where(User.email == email)
-        ).scalar_one_or_none(db_session)
+        user = await _get_user_cached(email, db_session)
 
         if user is None:
             logger.error('Не найден пользователь')
@@ -65,7 +153,7 @@ async def get_current_user(
                     detail="Not enough permissions",
                     headers={"WWW-Authenticate": f'Bearer scope="{security_scopes.scope_str}"'},
                 )
-    except JWTError as e:
+    except PyJWTError as e:
         logger.error(f'Во время декодирования произошла ошибка: {e}')
         raise NotAuthException
 
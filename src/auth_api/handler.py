@@ -1,12 +1,22 @@
+import asyncio
+import jwt
 from argon2.exceptions import VerifyMismatchError, VerificationError
 from loguru import logger
-from pydantic import SecretStr
 from datetime import datetime, timedelta, timezone
-from jose import jwt
 from argon2 import PasswordHasher
 
 from ..config import config
 
+# JWT-параметры фиксируются один раз при импорте,
+# чтобы не обращаться к config на каждое создание/декодирование токена
+_SECRET_KEY = config.auth_config.SECRET_KEY
+_ALGORITHM = config.auth_config.ALGORITHM
+
+# Ограничение числа одновременных хешей: argon2 заметно ест CPU и память,
+# без лимита всплеск логинов/регистраций занял бы весь пул потоков
+_HASH_CONCURRENCY_LIMIT = 4
+_hash_semaphore = asyncio.Semaphore(_HASH_CONCURRENCY_LIMIT)
+
 
 class AuthHandler:
     """Класс для обработки операций аутентификации и авторизации.
@@ -17,16 +27,19 @@ class AuthHandler:
     _pwd_context = PasswordHasher()
 
     @classmethod
-    async def get_password_hash(cls, password: SecretStr) -> str:
+    async def get_password_hash(cls, password: str) -> str:
         """Генерирует хеш пароля.
 
         Args:
-            password: Пароль в чистом виде (обернутый в SecretStr для безопасности)
+            password: Пароль в чистом виде
 
         Returns:
             str: Хешированная строка пароля
         """
-        return cls._pwd_context.hash(password.get_secret_value())
+        # Хеширование - CPU-bound операция, выносим её в пул потоков,
+        # чтобы не блокировать event loop на время подбора хеша
+        async with _hash_semaphore:
+            return await asyncio.to_thread(cls._pwd_context.hash, password)
 
     @classmethod
     async def verify_password(
@@ -44,7 +57,13 @@ class AuthHandler:
             bool: True если пароль верный, иначе False
         """
         try:
-            return cls._pwd_context.verify(hashed_password, plain_password)
+            # Проверка хеша так же затратна, как и его создание - тоже в пул потоков
+            async with _hash_semaphore:
+                return await asyncio.to_thread(
+                    cls._pwd_context.verify,
+                    hashed_password,
+                    plain_password
+                )
         except VerifyMismatchError:
             return False
         except VerificationError as e:
@@ -57,8 +76,8 @@ class AuthHandler:
     @staticmethod
     async def encode_jwt(
             payload: dict,
-            secret_key: str = config.auth_config.SECRET_KEY,
-            algorithm: str = config.auth_config.ALGORITHM
+            secret_key: str = _SECRET_KEY,
+            algorithm: str = _ALGORITHM
     ) -> str:
         """Кодирует данные в JWT токен.
 
@@ -80,8 +99,8 @@ class AuthHandler:
     @staticmethod
     async def decode_jwt(
             token: str | bytes,
-            secret_key: str = config.auth_config.SECRET_KEY,
-            algorithm: str = config.auth_config.ALGORITHM
+            secret_key: str = _SECRET_KEY,
+            algorithm: str = _ALGORITHM
     ) -> dict:
         """Декодирует JWT токен.
 
@@ -94,7 +113,7 @@ class AuthHandler:
             dict: Раскодированные данные из токена
 
         Raises:
-            JWTError: Если токен невалидный
+            PyJWTError: Если токен невалидный
         """
         decoded = jwt.decode(
             token,
@@ -122,7 +141,7 @@ class AuthHandler:
         encode.update({"exp": expire})
         token = jwt.encode(
             encode,
-            key=config.auth_config.SECRET_KEY,
-            algorithm=config.auth_config.ALGORITHM
+            key=_SECRET_KEY,
+            algorithm=_ALGORITHM
         )
         return token
@@ -14,7 +14,7 @@ class User(Base):
         password(str): Хэшированный пароль пользователя. Хранится в зашифрованном виде.
         scopes: Права допустимые пользователю в системе
     """
-    username: Mapped[str] = mapped_column(nullable=False)
+    username: Mapped[str] = mapped_column(nullable=False, index=True)
     email: Mapped[str] = mapped_column(nullable=False, unique=True)
     password: Mapped[str] = mapped_column(nullable=False)
     scopes: Mapped[list[str]] = mapped_column(
@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends
 from fastapi.security import OAuth2PasswordRequestForm
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from typing import Annotated
 
-from ..database.session import DbSessionDepends
+from ..database.session import DbSession, DbSessionCommit
 from .service import AuthService
 from .schemes import RegistrateUserScheme
 from .schemes import TokenScheme
@@ -11,13 +11,14 @@ from .schemes import TokenScheme
 auth_api_router = APIRouter(
     prefix='/auth_api',
     tags=['auth'],
+    default_response_class=ORJSONResponse,
 )
 
 
 @auth_api_router.post('/token', name='token', response_model=TokenScheme)
 async def token(
         form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
-        db_session: DbSessionDepends(),
+        db_session: DbSession,
 ) -> TokenScheme:
     """Выпускает JWT токен доступа при успешной аутентификации.
 
@@ -35,10 +36,10 @@ async def token(
     return await AuthService.get_token(form_data, db_session)
 
 
-@auth_api_router.post('/register', name='register', response_class=JSONResponse)
+@auth_api_router.post('/register', name='register', response_class=ORJSONResponse)
 async def register(
         register_user: RegistrateUserScheme,
-        session: DbSessionDepends(commit=True)
+        session: DbSessionCommit
 ):
     """Регистрирует нового пользователя в системе.
 
@@ -47,7 +48,7 @@ async def register(
         session (AsyncSession): Сессия базы данных с авто-коммитом
 
     Returns:
-        JSONResponse: Сообщение об успешной регистрации
+        ORJSONResponse: Сообщение об успешной регистрации
 
     Raises:
         HTTPException(409): Если пользователь с таким именем уже существует
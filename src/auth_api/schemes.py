@@ -1,18 +1,26 @@
-from pydantic import BaseModel, EmailStr, Field, SecretStr
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 class SystemUserScheme(BaseModel):
     """Форма юзера"""
+    # from_attributes позволяет pydantic читать поля прямо из ORM-объекта
+    # при валидации ответа, без промежуточного словаря
+    model_config = ConfigDict(from_attributes=True)
+
     username: str = Field(..., description='Имя пользователя')
     email: EmailStr = Field(..., description='Почта пользователя')
 
 
 class RegistrateUserScheme(SystemUserScheme):
     """Форма регистрации пользователя"""
-    password: SecretStr = Field(..., description='Введенный пароль, в дальнейшем хэшируется')
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    password: str = Field(..., description='Введенный пароль, в дальнейшем хэшируется')
 
 
 class TokenScheme(BaseModel):
     """Модель токена аунтефикации"""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     access_token: str = Field(..., description='Токен')
     token_type: str = Field(..., description='Тип токена')
@@ -1,10 +1,13 @@
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi import HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from loguru import logger
-from sqlalchemy import select, insert
+from sqlalchemy import select, bindparam
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import load_only
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from jwt.exceptions import PyJWTError
 
 from .models import User
 from .handler import AuthHandler
@@ -12,6 +15,41 @@ from .schemes import TokenScheme, RegistrateUserScheme
 from ..config import config
 from ..database.executer import sql_manager
 
+# Запрос строится один раз при импорте; на каждый логин подставляется
+# только значение почты через .params(), компиляция берется из кэша SQLAlchemy
+_USER_BY_EMAIL_STMT = (
+    select(User)
+    .options(load_only(User.email, User.password, User.scopes))
+    .where(User.email == bindparam('email'))
+)
+
+# SQLSTATE-код нарушения уникальности в PostgreSQL
+_UNIQUE_VIOLATION_CODE = '23505'
+
+# Тело успешного ответа регистрации не зависит от запроса, собирается один раз
+_REGISTER_SUCCESS_CONTENT = {"message": 'Вы зарегистрированы'}
+
+
+def _is_unique_violation(error: IntegrityError) -> bool:
+    """Проверяет, что IntegrityError вызвана нарушением уникальности.
+
+    Опирается на SQLSTATE-код PostgreSQL (23505) вместо поиска подстроки
+    в тексте ошибки, который зависит от локали и формулировок драйвера.
+
+    Args:
+        error (IntegrityError): Исключение, пойманное при вставке
+
+    Returns:
+        bool: True если причина - нарушение уникального ограничения
+    """
+    orig = error.orig
+    code = getattr(orig, 'sqlstate', None) or getattr(orig, 'pgcode', None)
+    if code is None and orig is not None and orig.__cause__ is not None:
+        # asyncpg-драйвер оборачивает исходное исключение, код лежит в причине
+        cause = orig.__cause__
+        code = getattr(cause, 'sqlstate', None) or getattr(cause, 'pgcode', None)
+    return code == _UNIQUE_VIOLATION_CODE
+
 
 class AuthService:
     @staticmethod
@@ -31,7 +69,7 @@ class AuthService:
         """
         try:
             user = await sql_manager(
-                select(User).where(User.email == form_data.username)
+                _USER_BY_EMAIL_STMT.params(email=form_data.username)
             ).scalar_one_or_none(db_session)
 
             if not user:
@@ -61,7 +99,8 @@ class AuthService:
             )
         except HTTPException:
             raise
-        except Exception:
+        except (SQLAlchemyError, PyJWTError) as e:
+            logger.error(f'Ошибка при выдаче токена: {e}')
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail='Ошибка сервера')
 
     @staticmethod
@@ -73,27 +112,41 @@ class AuthService:
             db_session (AsyncSession): Сессия базы данных
 
         Returns:
-            JSONResponse: Ответ об успешной регистрации
+            ORJSONResponse: Ответ об успешной регистрации
 
         Raises:
             HTTPException(409): При нарушении уникальности (дубликат пользователя)
             HTTPException(500): При других ошибках базы данных или сервера
         """
         try:
-            register_user.password = await AuthHandler.get_password_hash(register_user.password)
+            # Схема заморожена (frozen=True), поэтому хеш подставляется
+            # в словарь значений, а не в саму модель
+            values = register_user.model_dump()
+            values['password'] = await AuthHandler.get_password_hash(register_user.password)
 
+            # ON CONFLICT DO NOTHING позволяет распознать дубликат по пустому
+            # RETURNING, не раскручивая исключение и откат транзакции
             user = await sql_manager(
-                insert(User).values(**register_user.model_dump()).returning(User)
+                pg_insert(User)
+                .values(**values)
+                .on_conflict_do_nothing(index_elements=['email'])
+                .returning(User)
             ).scalar_one_or_none(db_session)
 
+            if user is None:
+                logger.error('Такой пользователь уже есть')
+                raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Конфликт: данные уже существуют")
+
             logger.info(f'Пользователь {user.username} зарегистрирован')
-            return JSONResponse(
-                content={"message": 'Вы зарегистрированы'},
+            return ORJSONResponse(
+                content=_REGISTER_SUCCESS_CONTENT,
                 status_code=status.HTTP_200_OK
             )
 
+        except HTTPException:
+            raise
         except IntegrityError as e:
-            if "unique constraint" in str(e.orig).lower():
+            if _is_unique_violation(e):
                 logger.error('Такой пользователь уже есть')
                 raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Конфликт: данные уже существуют")
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Ошибка сервера")
@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import EmailStr, HttpUrl
@@ -99,7 +100,20 @@ class Config(BaseSettings):
         return datetime.now(ZoneInfo("Europe/Moscow"))
 
 
+@lru_cache
+def get_config() -> Config:
+    """Создает и кэширует единственный экземпляр конфигурации.
+
+    .env парсится ровно один раз за время жизни процесса: повторные
+    вызовы возвращают тот же объект вместо повторного чтения файла.
+
+    Returns:
+        Config: Экземпляр конфигурации приложения
+    """
+    return Config()
+
+
 try:
-    config = Config()
+    config = get_config()
 except Exception as e:
     logger.error(f'Во время парсинга .env произошла ошибка: {e}')
@@ -13,6 +13,10 @@ class DatabaseConfig(BaseSettings):
         POSTGRES_DB(str): Имя базы данных
         POSTGRES_USER(str): Пользователь БД
         POSTGRES_PASSWORD(str): Пароль пользователя БД
+        DB_POOL_SIZE(int): Число постоянных соединений в пуле
+        DB_MAX_OVERFLOW(int): Сколько дополнительных соединений можно открыть под нагрузкой
+        DB_POOL_TIMEOUT(int): Сколько секунд ждать свободное соединение
+        DB_POOL_RECYCLE(int): Через сколько секунд пересоздавать соединение
     """
     # Настройки базы данных
     DB_HOST: str
@@ -21,6 +25,12 @@ class DatabaseConfig(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
 
+    # Настройки пула соединений
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+
     model_config = SettingsConfigDict(
         env_file=Path(__file__).parent.parent.parent / ".env",
         env_file_encoding='utf-8',
@@ -41,7 +41,8 @@ class QueryWrapper:
         Returns:
             Result: Результат выполнения запроса SQLAlchemy.
         """
-        logger.info(f'Выполняется query: {self.query}')
+        # lazy=True: SQL-текст запроса собирается только если уровень DEBUG включен
+        logger.opt(lazy=True).debug('Выполняется query: {}', lambda: str(self.query))
         result = await session.execute(self.query)
         return result
 
@@ -1,10 +1,9 @@
-from fastapi import Depends, Request
-from sqlalchemy import text
+from fastapi import Depends
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, AsyncSession, AsyncEngine
-from functools import wraps
+import time
+from functools import lru_cache, wraps
 from typing import AsyncIterator, Annotated
 from loguru import logger
-from datetime import datetime
 from contextlib import asynccontextmanager
 
 from ..config import config
@@ -12,6 +11,27 @@ from ..config import config
 SQL_DATABASE_URL = config.database_config.database_url_postgresql
 
 
+def _session_logging_enabled() -> bool:
+    """Проверяет, нужен ли журнал жизненного цикла сессий.
+
+    Сравнивает настроенный уровень логирования с INFO через
+    logger.level().no: если INFO отфильтрован, замеры времени и
+    служебные сообщения сессий можно пропускать целиком.
+
+    Returns:
+        bool: True если сообщения уровня INFO проходят в логи
+    """
+    level_name = config.logger_config.LEVEL or "INFO"
+    try:
+        return logger.level(level_name).no <= logger.level("INFO").no
+    except ValueError:
+        return True
+
+
+# Вычисляется один раз при импорте: уровень логирования за время жизни процесса не меняется
+_SESSION_LOG_ENABLED = _session_logging_enabled()
+
+
 class DatabaseSessionManager:
     """
     Менеджер для управления асинхронными сессиями базы данных.
@@ -43,6 +63,7 @@ class DatabaseSessionManager:
         self.database_url = database_url
         self.engine = engine
         self.session_factory = session_factory
+        self._isolation_factories: dict[str, async_sessionmaker[AsyncSession]] = {}
 
     async def init(self):
         """
@@ -52,8 +73,14 @@ class DatabaseSessionManager:
         с отключенным autoflush и expire_on_commit для лучшего контроля над сессиями.
         Должен вызываться при начале работы приложения.
         """
+        # Размер пула подобран под асинхронную нагрузку FastAPI:
+        # базовые соединения держатся открытыми, overflow покрывает всплески
         self.engine = create_async_engine(
             url=self.database_url,
+            pool_size=config.database_config.DB_POOL_SIZE,
+            max_overflow=config.database_config.DB_MAX_OVERFLOW,
+            pool_timeout=config.database_config.DB_POOL_TIMEOUT,
+            pool_recycle=config.database_config.DB_POOL_RECYCLE,
         )
         self.session_factory = async_sessionmaker(
             bind=self.engine,
@@ -61,6 +88,34 @@ class DatabaseSessionManager:
             autoflush=False
         )
 
+    def _get_session_factory(self, isolation_level: str | None) -> async_sessionmaker[AsyncSession]:
+        """Возвращает фабрику сессий для нужного уровня изоляции.
+
+        Уровень изоляции задается через engine.execution_options и
+        применяется драйвером при выдаче соединения из пула, поэтому
+        отдельный round-trip SET TRANSACTION на каждый запрос не нужен.
+        Фабрика для каждого уровня создается один раз и кэшируется.
+
+        Args:
+            isolation_level: Уровень изоляции транзакции или None
+
+        Returns:
+            async_sessionmaker[AsyncSession]: Фабрика сессий
+        """
+        if isolation_level is None:
+            return self.session_factory
+
+        factory = self._isolation_factories.get(isolation_level)
+        if factory is None:
+            isolation_engine = self.engine.execution_options(isolation_level=isolation_level)
+            factory = async_sessionmaker(
+                bind=isolation_engine,
+                expire_on_commit=False,
+                autoflush=False
+            )
+            self._isolation_factories[isolation_level] = factory
+        return factory
+
     async def close(self):
         """
         Закрывает соединения с базой данных.
@@ -86,7 +141,10 @@ class DatabaseSessionManager:
         Args:
             isolation_level (str | None, optional):
                 Уровень изоляции транзакции (например, "READ COMMITTED", "REPEATABLE READ").
-                Defaults to None.
+                Для согласованного чтения предпочитайте "REPEATABLE READ":
+                "SERIALIZABLE" нужен только при реальных конфликтах записи,
+                так как заставляет PostgreSQL отслеживать зависимости и
+                чаще перезапускать транзакции. Defaults to None.
             commit (bool, optional):
                 Автоматически коммитить транзакцию при успешном завершении.
                 Defaults to False.
@@ -98,28 +156,27 @@ class DatabaseSessionManager:
             Exception: Любое исключение, возникшее в контексте сессии,
                        приводит к откату транзакции и пробрасывается дальше.
         """
-        start_time = datetime.now()
-        logger.info(f"Создание новой сессии. Изоляция: {isolation_level}, Автокоммит: {commit}")
-        async with self.session_factory() as session:
+        if _SESSION_LOG_ENABLED:
+            start_time = time.perf_counter()
+            # Параметры передаются loguru отдельно: строка форматируется
+            # только если уровень INFO вообще принимается каким-либо sink
+            logger.info("Создание новой сессии. Изоляция: {}, Автокоммит: {}", isolation_level, commit)
+        async with self._get_session_factory(isolation_level)() as session:
             try:
-                if isolation_level:
-                    logger.debug(f"Установка уровня изоляции: {isolation_level}")
-                    await session.execute(
-                        text(f"SET TRANSACTION ISOLATION LEVEL {isolation_level}")
-                    )
-                yield session
                 if commit:
-                    await session.commit()
-                    logger.info("Изменения успешно закоммичены")
-            except Exception as e:
-                logger.error(f"Ошибка в сессии: {str(e)}", exc_info=True)
-                await session.rollback()
-                logger.info("Выполнен откат транзакции")
-                raise
+                    # begin() сам коммитит при успешном выходе и
+                    # откатывает при исключении
+                    async with session.begin():
+                        yield session
+                    if _SESSION_LOG_ENABLED:
+                        logger.info("Изменения успешно закоммичены")
+                else:
+                    yield session
             finally:
-                await session.close()
-                exec_time = (datetime.now() - start_time).total_seconds()
-                logger.info(f"Сессия закрыта. Время выполнения: {exec_time:.2f} сек")
+                # async with закрывает сессию сам, явный close() не нужен
+                if _SESSION_LOG_ENABLED:
+                    exec_time = time.perf_counter() - start_time
+                    logger.info("Сессия закрыта. Время выполнения: {:.2f} сек", exec_time)
 
     def connection(self, isolation_level: str | None = None, commit: bool = False):
         """
@@ -143,37 +200,42 @@ class DatabaseSessionManager:
         def decorator(method):
             @wraps(method)
             async def wrapper(*args, **kwargs):
-                start_time = datetime.now()
-                logger.info(
-                    f"Начало транзакции для {method.__name__}. Изоляция: {isolation_level}, Автокоммит: {commit}")
-                async with self.session_factory() as session:
+                if _SESSION_LOG_ENABLED:
+                    start_time = time.perf_counter()
+                    logger.info(
+                        "Начало транзакции для {}. Изоляция: {}, Автокоммит: {}",
+                        method.__name__, isolation_level, commit
+                    )
+                async with self._get_session_factory(isolation_level)() as session:
                     try:
-                        if isolation_level:
-                            logger.debug(f"Установка уровня изоляции: {isolation_level}")
-                            await session.execute(text(f"SET TRANSACTION ISOLATION LEVEL {isolation_level}"))
-                        result = await method(*args, db_session=session, **kwargs)
                         if commit:
-                            await session.commit()
-                            logger.info("Изменения успешно закоммичены")
+                            # begin() сам коммитит при успешном выходе и
+                            # откатывает при исключении
+                            async with session.begin():
+                                result = await method(*args, db_session=session, **kwargs)
+                            if _SESSION_LOG_ENABLED:
+                                logger.info("Изменения успешно закоммичены")
+                        else:
+                            result = await method(*args, db_session=session, **kwargs)
                         return result
-                    except Exception as e:
-                        logger.error(f"Ошибка в транзакции {method.__name__}: {str(e)}", exc_info=True)
-                        await session.rollback()
-                        logger.info("Выполнен откат транзакции")
-                        raise
                     finally:
-                        await session.close()
-                        exec_time = (datetime.now() - start_time).total_seconds()
-                        logger.info(f"Транзакция завершена. Время выполнения: {exec_time:.2f} сек")
+                        if _SESSION_LOG_ENABLED:
+                            exec_time = time.perf_counter() - start_time
+                            logger.info("Транзакция завершена. Время выполнения: {:.2f} сек", exec_time)
 
             return wrapper
 
         return decorator
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def dependency(isolation_level: str | None = None, commit: bool = False):
         """Создает зависимость FastAPI для работы с сессиями.
 
+        Результат кэшируется по паре (isolation_level, commit): повторные
+        вызовы с теми же параметрами возвращают один и тот же объект
+        Annotated, поэтому FastAPI видит одну общую зависимость.
+
         Args:
             isolation_level: Уровень изоляции транзакции
             commit: Флаг автоматического коммита
@@ -182,17 +244,23 @@ class DatabaseSessionManager:
             Annotated[AsyncSession, Depends]: Зависимость для внедрения сессии
 
         Raises:
-            RuntimeError: Если менеджер не инициализирован в app.state
+            RuntimeError: Если глобальный менеджер не инициализирован
         """
 
-        async def get_session(request: Request) -> AsyncIterator[AsyncSession]:
-            if not hasattr(request.app.state, 'db_manager'):
-                raise RuntimeError("Менеджер бд должен быть инициализирован в app.state")
-
-            db_manager: DatabaseSessionManager = request.app.state.db_manager
-
-            async with db_manager.session(isolation_level, commit) as session:
-                yield session
+        async def get_session() -> AsyncIterator[AsyncSession]:
+            # Используем модульный session_manager напрямую: это одна и та же
+            # фабрика на весь процесс, без похода в request.app.state на каждый запрос
+            if session_manager.session_factory is None:
+                raise RuntimeError("Менеджер бд должен быть инициализирован (session_manager.init())")
+
+            if isolation_level is None and not commit:
+                # Типовой случай без опций: обходим session() с его
+                # таймингом и логикой коммита, фабрика сама закроет сессию
+                async with session_manager.session_factory() as session:
+                    yield session
+            else:
+                async with session_manager.session(isolation_level, commit) as session:
+                    yield session
 
         return Annotated[AsyncSession, Depends(get_session)]
 
@@ -200,3 +268,8 @@ class DatabaseSessionManager:
 # Глобальный экземпляр менеджера сессий
 session_manager = DatabaseSessionManager(SQL_DATABASE_URL)
 DbSessionDepends = session_manager.dependency
+
+# Готовые зависимости для типовых случаев, собранные один раз при импорте,
+# чтобы не вызывать фабрику в каждой сигнатуре эндпоинта
+DbSession = DbSessionDepends()
+DbSessionCommit = DbSessionDepends(commit=True)
@@ -1,23 +1,26 @@
+# Стандартные описания статусов: словарь общий для всех билдеров,
+# собирается один раз при импорте, а не при каждом DocBuilder()
+STATUS_DESCRIPTIONS = {
+    200: "Успешно",
+    201: "Создано",
+    202: "Принято",
+    204: "Нет содержимого",
+    400: "Неверный запрос",
+    401: "Не авторизован",
+    403: "Доступ запрещен",
+    404: "Не найдено",
+    409: "Конфликт",
+    422: "Ошибка валидации",
+    429: "Слишком много запросов",
+    500: "Внутренняя ошибка сервера",
+    502: "Ошибка шлюза",
+    503: "Сервис недоступен",
+}
+
+
 class DocBuilder:
     def __init__(self, summary: str = ""):
         self._data = {"summary": summary}
-        # Стандартные описания статусов
-        self._status_descriptions = {
-            200: "Успешно",
-            201: "Создано",
-            202: "Принято",
-            204: "Нет содержимого",
-            400: "Неверный запрос",
-            401: "Не авторизован",
-            403: "Доступ запрещен",
-            404: "Не найдено",
-            409: "Конфликт",
-            422: "Ошибка валидации",
-            429: "Слишком много запросов",
-            500: "Внутренняя ошибка сервера",
-            502: "Ошибка шлюза",
-            503: "Сервис недоступен",
-        }
 
     def name(self, name: str) -> 'DocBuilder':
         self._data["name"] = name
@@ -41,7 +44,7 @@ class DocBuilder:
             description = exception.detail
 
         if description is None:
-            description = self._status_descriptions.get(
+            description = STATUS_DESCRIPTIONS.get(
                 status_code,
                 f"Статус {status_code}"
             )
@@ -56,9 +56,10 @@ async def create_admin(db_session: AsyncSession):
             email=config.ADMIN_EMAIL,
             password=config.ADMIN_PASSWORD
         )
-        register_user.password = await AuthHandler.get_password_hash(register_user.password)
+        values = register_user.model_dump()
+        values['password'] = await AuthHandler.get_password_hash(register_user.password)
         await sql_manager(
-            insert(User).values(**register_user.model_dump())
+            insert(User).values(**values)
         ).execute(db_session)
         logger.success("Администратор создан успешно")
     else:
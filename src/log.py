@@ -34,8 +34,20 @@ class InterceptHandler(logging.Handler):
         )
 
 
+# Флаг, что логирование уже настроено: повторные вызовы setup_logger игнорируются
+_configured = False
+
+
 def setup_logger():
-    """Настраивает систему логирования приложения."""
+    """Настраивает систему логирования приложения.
+
+    Идемпотентна: повторные вызовы (например, из lifespan при нескольких
+    воркерах тестов или из скриптов) не добавляют дублирующих sink'ов.
+    """
+    global _configured
+    if _configured:
+        return
+    _configured = True
 
     # Удаляем существующие обработчики логов
     for handler in logging.root.handlers[:]:
@@ -4,6 +4,7 @@ from typing import Any
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 from pydantic import BaseModel
 
@@ -19,6 +20,14 @@ class AppState(BaseModel):
     db_manager: Any
 
 
+# Единая таблица роутеров приложения: каждый роутер определяется в своем
+# модуле один раз и подключается только отсюда
+routers = (
+    auth_api_router,
+    users_router,
+)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Контекстный менеджер для управления жизненным циклом приложения.
@@ -28,6 +37,9 @@ async def lifespan(app: FastAPI):
     """
     app.state: AppState
 
+    # Настройка логирования при старте приложения (повторный вызов безопасен)
+    setup_logger()
+
     # Инициализация сессий sql базы
     await session_manager.init()
 
@@ -52,24 +64,26 @@ def create_app() -> FastAPI:
         contact=config.contact_project,
         docs_url=config.DOCS_URL,
         redoc_url=config.REDOC_URL,
-        lifespan=lifespan
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse
     )
+    # Явные списки методов и заголовков вместо "*": middleware сравнивает
+    # preflight-запросы по точному множеству, а приложению нужны только они
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=["GET", "POST"],
+        allow_headers=["Authorization", "Content-Type"],
     )
-    app.include_router(auth_api_router)  # Установка роутера авторизации
-    app.include_router(users_router)
+    for router in routers:
+        app.include_router(router)
 
     return app
 
 
 if __name__ == '__main__':
     try:
-        setup_logger()
         app = create_app()
         uvicorn.run(
             app,